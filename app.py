@@ -1,16 +1,43 @@
+import functools
+import io
 import numpy as np
 import gradio as gr
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Optional
 import matplotlib.ticker as mtick
+from PIL import Image
+from kernels import MONEY_DTYPE, cash_buy_and_sell_core as _cash_buy_and_sell_py
+
+# Prefer the ahead-of-time compiled kernels built by build_kernels.py, falling back to JIT compilation
+try:
+    from mortgage_kernels import cash_buy_and_sell_core
+except ImportError:
+    from numba import njit
+    cash_buy_and_sell_core = njit(cache=True)(_cash_buy_and_sell_py)
+
+# Persistent figures, redrawn on every analysis instead of being recreated
+_FIG, _AX = plt.subplots(figsize=(8, 5), dpi=72)
+_CASH_FLOW_FIG, _CASH_FLOW_AX = plt.subplots(figsize=(8, 5), dpi=72)
+
+# Utility function: Render a figure to an in-memory image
+def figure_to_image(fig: plt.Figure) -> Image.Image:
+    """Renders a figure to a PNG in memory and returns it as a PIL image."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=fig.dpi)
+    buf.seek(0)
+    image = Image.open(buf)
+    image.load()
+    return image
 
 # Utility function: Convert percentages to decimal for calculation
 def convert_percentages_to_decimal(*rates: float) -> List[float]:
     """Converts percentage rates to decimal form for calculations."""
-    return [rate / 100 for rate in rates]
+    return (np.asarray(rates, dtype=MONEY_DTYPE) / 100).tolist()
 
 # Loan calculation function
-def calculate_loan_details(house_value: float, loan_percentage: float, loan_rate: float, loan_years: int, loan_type: str) -> Tuple[float, float, List[float]]:
+def calculate_loan_details(house_value: float, loan_percentage: float, loan_rate: float, loan_years: int, loan_type: str) -> Tuple[float, float, np.ndarray]:
     """Calculates loan details including down payment, loan amount, and monthly payments."""
     loan_amount = house_value * loan_percentage
     down_payment = house_value - loan_amount
@@ -20,137 +47,171 @@ def calculate_loan_details(house_value: float, loan_percentage: float, loan_rate
     if loan_type == "Annuity":
         monthly_payment = (loan_amount * monthly_interest_rate * (1 + monthly_interest_rate) ** loan_term_months) / \
                           ((1 + monthly_interest_rate) ** loan_term_months - 1)
-        monthly_payments = [monthly_payment] * loan_term_months
+        monthly_payments = np.full(loan_term_months, monthly_payment, dtype=MONEY_DTYPE)
     elif loan_type == "Linear":
-        monthly_payments = [
-            loan_amount / loan_term_months + loan_amount * monthly_interest_rate * (1 - (month - 1) / loan_term_months)
-            for month in range(1, loan_term_months + 1)
-        ]
+        months = np.arange(loan_term_months, dtype=MONEY_DTYPE)
+        monthly_payments = loan_amount / loan_term_months + loan_amount * monthly_interest_rate * (1 - months / loan_term_months)
     else:
         raise ValueError("Invalid loan type")
 
     return down_payment, loan_amount, monthly_payments
 
+# Annual payment totals
+def calculate_annual_payments(monthly_payments: np.ndarray, max_years: int, loan_type: str) -> np.ndarray:
+    """Sums the monthly payments per year, with zero payments after the loan term ends."""
+    if loan_type == "Annuity":
+        # The monthly payment is constant, so every year of the loan costs twelve of them
+        annual_payments = np.zeros(max_years, dtype=MONEY_DTYPE)
+        annual_payments[:len(monthly_payments) // 12] = 12 * monthly_payments[0]
+        return annual_payments
+
+    # Pad with zeros past the loan term so the schedule reshapes into whole years
+    padded_payments = np.zeros(max_years * 12, dtype=MONEY_DTYPE)
+    months = min(len(monthly_payments), max_years * 12)
+    padded_payments[:months] = monthly_payments[:months]
+    return padded_payments.reshape(max_years, 12).sum(axis=1)
+
+# Remaining mortgage balance
+def calculate_remaining_payments(monthly_payments: np.ndarray, max_years: int) -> np.ndarray:
+    """Returns the sum of all payments from each month onward, zero once the loan is paid off."""
+    # Sized so any month up to the end of the analysis can be looked up without bounds checks
+    remaining_payments = np.zeros(max(len(monthly_payments), max_years * 12) + 1, dtype=MONEY_DTYPE)
+    remaining_payments[:len(monthly_payments)] = np.cumsum(monthly_payments[::-1])[::-1]
+    return remaining_payments
+
 # Cumulative costs calculation
-def calculate_cumulative_costs(house_value: float, initial_rent: float, rent_inflation_rate: float, appreciation_rate: float,
-                               initial_maintenance_cost: float, maintenance_inflation_rate: float, monthly_payments: List[float],
-                               max_sell_year: int, initial_investment: float) -> Tuple[List[float], List[float]]:
+def calculate_cumulative_costs(annual_rent: np.ndarray, annual_maintenance_costs: np.ndarray, annual_payments: np.ndarray,
+                               initial_investment: float) -> Tuple[np.ndarray, np.ndarray]:
     """Calculates cumulative costs for renting and owning over a period of years."""
-    renting_cumulative_costs = []
-    owning_cumulative_costs = []
-    cumulative_rent_cost = 0
-    cumulative_owning_cost = initial_investment
-
-    for year in range(1, max_sell_year + 1):
-        annual_rent = initial_rent * (1 + rent_inflation_rate) ** (year - 1)
-        cumulative_rent_cost += annual_rent
-        renting_cumulative_costs.append(cumulative_rent_cost)
-
-        annual_maintenance_cost = initial_maintenance_cost * (1 + maintenance_inflation_rate) ** (year - 1)
-        cumulative_owning_cost += sum(monthly_payments[(year - 1) * 12:year * 12]) + annual_maintenance_cost
-        owning_cumulative_costs.append(cumulative_owning_cost)
+    renting_cumulative_costs = np.cumsum(annual_rent)
+    owning_cumulative_costs = initial_investment + np.cumsum(annual_payments + annual_maintenance_costs)
 
     return renting_cumulative_costs, owning_cumulative_costs
 
 # Break-even year determination
-def determine_break_even_year(renting_costs: List[float], owning_costs: List[float], years: List[int]) -> int:
+def determine_break_even_year(renting_costs: np.ndarray, owning_costs: np.ndarray, years: List[int]) -> int:
     """Determines the break-even year where owning becomes cheaper than renting."""
-    for i, (rent_cost, own_cost) in enumerate(zip(renting_costs, owning_costs)):
-        if own_cost < rent_cost:
-            return years[i]
-    return None
-
-def calculate_post_sale_raw_cash(house_value: float, appreciation_rate: float, sell_tax_rate: float, years: List[int]) -> List[float]:
-    """Calculates the post-sale cash on hand after selling the property."""
-    post_sale_cash = []
-    for year in years:
-        property_value = house_value * (1 + appreciation_rate) ** (year-1)
-        profit = property_value - house_value
-        sell_after_tax = property_value - profit * sell_tax_rate
-        post_sale_cash.append(sell_after_tax)
-    return post_sale_cash
+    mask = np.less(owning_costs, renting_costs)
+    return int(years[mask.argmax()]) if mask.any() else None
 
 # Post-sale cash calculation
-def calculate_post_sale_cash(house_value: float, appreciation_rate: float, sell_tax_rate: float, owning_costs: List[float], years: List[int]) -> Dict[str, float]:
-    """Calculates the post-sale cash on hand after selling the property."""
-    post_sale_cash = {}
-    for year in years:
-        property_value = house_value * (1 + appreciation_rate) ** year
-        profit = property_value - house_value
-        sell_tax = profit * sell_tax_rate
-        net_cash_after_sale = property_value - owning_costs[year - 1] - sell_tax
-        post_sale_cash[str(year)] = round(net_cash_after_sale, 2)
-    return post_sale_cash
-
-def plot_results(years: List[int], renting_costs: List[float], owning_costs: List[float], break_even_year: int, title: str) -> str:
+def calculate_post_sale_cash(house_value: float, appreciation_factor: np.ndarray, sell_tax_rate: float,
+                             owning_costs: Optional[np.ndarray] = None) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Calculates the cash from selling the property after tax, and net of owning costs when they are given."""
+    property_value = house_value * appreciation_factor
+    profit = property_value - house_value
+    sell_tax = profit * sell_tax_rate
+    sell_after_tax = property_value - sell_tax
+    net_cash_after_sale = None if owning_costs is None else sell_after_tax - owning_costs
+    return sell_after_tax, net_cash_after_sale
+
+def plot_results(years: List[int], renting_costs: List[float], owning_costs: List[float], break_even_year: int, title: str) -> Image.Image:
     """Generates a plot of the cumulative costs for renting and owning."""
-    plt.figure(figsize=(10, 6))
-    plt.plot(years, renting_costs, label="Cumulative Rent Cost", linestyle='--')
-    plt.plot(years, owning_costs, label="Cumulative Buying Cost", linestyle='-')
+    _AX.clear()
+    _AX.plot(years, renting_costs, label="Cumulative Rent Cost", linestyle='--')
+    _AX.plot(years, owning_costs, label="Cumulative Buying Cost", linestyle='-')
     if break_even_year is not None:
-        plt.axvline(x=break_even_year, color='grey', linestyle=':', label=f'Break-even Year: {break_even_year}')
-    plt.xlabel('Year')
-    plt.ylabel('Cumulative Cost (€)')
-    plt.title(title)
-    plt.legend()
-    plt.grid(True)
+        _AX.axvline(x=break_even_year, color='grey', linestyle=':', label=f'Break-even Year: {break_even_year}')
+    _AX.set_xlabel('Year')
+    _AX.set_ylabel('Cumulative Cost (€)')
+    _AX.set_title(title)
+    _AX.legend()
+    _AX.grid(True)
     
     # Disable scientific notation for the entire plot
-    plt.ticklabel_format(style='plain', axis='y')
+    _AX.ticklabel_format(style='plain', axis='y')
 
     # Add thousand separators for better readability
-    ax = plt.gca()
-    ax.yaxis.set_major_formatter(mtick.StrMethodFormatter('{x:,.0f}'))
+    _AX.yaxis.set_major_formatter(mtick.StrMethodFormatter('{x:,.0f}'))
+
+    return figure_to_image(_FIG)
 
-    plt_path = f"{title.replace(' ', '_').lower()}.png"
-    plt.savefig(plt_path)
-    plt.close()
-    return plt_path
+# Compounded cash balance
+def compound_cash_flow(initial_cash: float, annual_flows: np.ndarray, growth_rate: float) -> np.ndarray:
+    """Returns the balance after each year of adding that year's cash flow and then compounding, as a prefix sum."""
+    # balance_T = (1 + r) ** T * (initial + sum_{t<=T} flow_t * (1 + r) ** (1 - t))
+    growth = (1 + growth_rate) ** np.arange(1, len(annual_flows) + 1, dtype=MONEY_DTYPE)
+    return growth * (initial_cash + np.cumsum(annual_flows * ((1 + growth_rate) / growth)))
 
 # Overall cash flow analysis
 def calculate_cash_flow_analysis(annual_salary: float, salary_growth_rate: float, opportunity_cost_rate: float,
-                                 monthly_payments: List[float], initial_rent: float, rent_inflation_rate: float, max_years: int,
-                                 initial_investment: float, maintenance_costs: List[float], annual_expenditure: float, sale_after_tax: List[float],
-                                 which_year_to_sell: int) -> Tuple[List[float], List[float], List[float]]:
+                                 annual_payments: np.ndarray, remaining_payments: np.ndarray, annual_rent: np.ndarray, max_years: int,
+                                 initial_investment: float, maintenance_costs: np.ndarray, annual_expenditure: float, sale_after_tax: List[float],
+                                 which_year_to_sell: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Calculates the overall cash flow analysis for renting and buying."""
-    cumulative_cash_rent = []
-    cumulative_cash_buy = []
-    cumulative_cash_buy_and_sell = []
-    cash_rent = initial_investment
-    cash_buy = initial_investment
-    for year in range(1, max_years + 1):
-        annual_salary *= (1 + salary_growth_rate)
-        net_savings = annual_salary - annual_expenditure
-
-        rent_cost = initial_rent * (1 + rent_inflation_rate) ** (year - 1)
-        cash_rent += net_savings - rent_cost
-        cash_rent *= (1 + opportunity_cost_rate)
-        cumulative_cash_rent.append(cash_rent)
-
-        total_buy_cost = sum(monthly_payments[(year - 1) * 12:year * 12]) + maintenance_costs[year - 1]
-        cash_buy += net_savings - total_buy_cost
-        cash_buy *= (1 + opportunity_cost_rate)
-        cumulative_cash_buy.append(cash_buy)
-        if year<which_year_to_sell:
-            cumulative_cash_buy_and_sell.append(cash_buy)
-        elif year==which_year_to_sell:
-            cash = cash_buy + sale_after_tax[year-1]
-            cash -= sum(monthly_payments[year * 12:]) # pay off the remaining mortgage
-            cumulative_cash_buy_and_sell.append(cash)
-        else: # year>which_year_to_sell
-            cash_buy_and_sell = cumulative_cash_buy_and_sell[-1] + net_savings - maintenance_costs[year - 1]
-            cash_buy_and_sell *= (1 + opportunity_cost_rate)
-            cumulative_cash_buy_and_sell.append(cash_buy_and_sell)
-
+    net_savings = annual_salary * (1 + salary_growth_rate) ** np.arange(1, max_years + 1, dtype=MONEY_DTYPE) - annual_expenditure
+    cumulative_cash_rent = compound_cash_flow(initial_investment, net_savings - annual_rent, opportunity_cost_rate)
+    cumulative_cash_buy = compound_cash_flow(initial_investment, net_savings - annual_payments - maintenance_costs, opportunity_cost_rate)
+    # Selling restarts the balance from the sale proceeds, so this one stays a sequential loop
+    cumulative_cash_buy_and_sell = cash_buy_and_sell_core(
+        cumulative_cash_buy, net_savings, opportunity_cost_rate, np.ascontiguousarray(remaining_payments, dtype=MONEY_DTYPE),
+        float(initial_investment), np.ascontiguousarray(maintenance_costs, dtype=MONEY_DTYPE),
+        np.ascontiguousarray(sale_after_tax, dtype=MONEY_DTYPE), int(which_year_to_sell)
+    )
     return cumulative_cash_rent, cumulative_cash_buy, cumulative_cash_buy_and_sell
 
-# Full Gradio app implementation
-def analysis_handler(mode, house_value, loan_percentage, loan_rate_percentage, loan_years, appreciation_rate_percentage,
-                     initial_maintenance_cost, maintenance_inflation_rate_percentage, initial_rent,
-                     rent_inflation_rate_percentage, sell_tax_rate_percentage, max_years, initial_investment,
-                     annual_salary, salary_growth_rate_percentage,
-                     opportunity_cost_rate_percentage, annual_expenditure, which_year_to_sell, mortgage_type):
-    """Handles the analysis based on the selected mode and input parameters."""
+# Cash flow plot
+def plot_cash_flow(years: List[int], cash_rent: List[float], cash_buy: List[float], cash_buy_and_sell: List[float]) -> Image.Image:
+    """Generates a plot of the cumulative cash for renting, buying, and buying then selling."""
+    # Plot cash flow results with updated colors and markers
+    ax = _CASH_FLOW_AX
+    ax.clear()
+
+    # Line 1: Renting, blue color with circular markers
+    ax.plot(
+        years, 
+        cash_rent, 
+        label="Cumulative Cash (Renting)", 
+        linestyle="--", 
+        color="blue", 
+        marker="o", 
+        linewidth=2
+    )
+
+    # Line 2: Buying, red color with square markers
+    ax.plot(
+        years, 
+        cash_buy, 
+        label="Cumulative Cash (Buying)", 
+        linestyle="-", 
+        color="red", 
+        marker="s", 
+        linewidth=2
+    )
+
+    # Line 3: Buying + Selling, yellow color with triangle markers
+    ax.plot(
+        years, 
+        cash_buy_and_sell, 
+        label="Cumulative Cash (Buying + Selling)", 
+        linestyle=":", 
+        color="green", 
+        marker="^", 
+        linewidth=2
+    )
+
+    # Axis labels and title
+    ax.set_xlabel("Year")
+    ax.set_ylabel("Cumulative Cash (€)")
+    ax.set_title("Overall Cash Flow Analysis")
+
+    # Add legend with improved visibility
+    ax.legend(title="Cumulative Cash Flows", loc="upper left", fontsize="medium")
+
+    # Add grid for readability
+    ax.grid(True)
+
+    # Render the figure, keeping it open for the next call
+    return figure_to_image(_CASH_FLOW_FIG)
+
+# Cached analysis computation
+@functools.lru_cache(maxsize=512)
+def run_analysis(mode, house_value, loan_percentage, loan_rate_percentage, loan_years, appreciation_rate_percentage,
+                 initial_maintenance_cost, maintenance_inflation_rate_percentage, initial_rent,
+                 rent_inflation_rate_percentage, sell_tax_rate_percentage, max_years, initial_investment,
+                 annual_salary, salary_growth_rate_percentage,
+                 opportunity_cost_rate_percentage, annual_expenditure, which_year_to_sell, mortgage_type) -> Dict:
+    """Runs the calculations for the selected mode, caching results per combination of inputs."""
 
     # Convert percentages to decimal
     appreciation_rate, rent_inflation_rate, maintenance_inflation_rate, loan_rate, sell_tax_rate, salary_growth_rate, opportunity_cost_rate = convert_percentages_to_decimal(
@@ -163,130 +224,104 @@ def analysis_handler(mode, house_value, loan_percentage, loan_rate_percentage, l
     down_payment, loan_amount, monthly_payments = calculate_loan_details(
         house_value, loan_percentage, loan_rate, loan_years, mortgage_type
     )
+    annual_payments = calculate_annual_payments(monthly_payments, max_years, mortgage_type)
+    remaining_payments = calculate_remaining_payments(monthly_payments, max_years)
+
+    # Growth factors (1 + rate) ** n, indexed by the number of years elapsed
+    years_idx = np.arange(max_years + 1, dtype=MONEY_DTYPE)
+    rent_factor = (1 + rent_inflation_rate) ** years_idx[:-1]
+    maintenance_factor = (1 + maintenance_inflation_rate) ** years_idx[:-1]
+    appreciation_factor = (1 + appreciation_rate) ** years_idx
+    annual_rent = initial_rent * rent_factor
+    annual_maintenance_costs = initial_maintenance_cost * maintenance_factor
 
     # Analysis based on the mode
     if mode == "Break-even Analysis":
         renting_costs, owning_costs = calculate_cumulative_costs(
-            house_value, initial_rent, rent_inflation_rate, appreciation_rate, initial_maintenance_cost,
-            maintenance_inflation_rate, monthly_payments, max_years, initial_investment
+            annual_rent, annual_maintenance_costs, annual_payments, initial_investment
         )
         years = list(range(1, max_years + 1))
         break_even_year = determine_break_even_year(renting_costs, owning_costs, years)
-        post_sale_cash = calculate_post_sale_cash(house_value, appreciation_rate, sell_tax_rate, owning_costs, years)
-        plot_path = plot_results(years, renting_costs, owning_costs, break_even_year, "Break-even Analysis")
+        # Break-even sells at the value reached after `year` years of appreciation
+        _, net_cash_after_sale = calculate_post_sale_cash(house_value, appreciation_factor[1:], sell_tax_rate, owning_costs)
+        post_sale_cash = dict(zip(map(str, years), np.round(net_cash_after_sale, 2).tolist()))
 
-        return plot_path, {
+        return {
             "Break-even Year": break_even_year,
-            "Cumulative Rent Costs": renting_costs,
-            "Cumulative Buying Costs": owning_costs,
+            "Cumulative Rent Costs": renting_costs.tolist(),
+            "Cumulative Buying Costs": owning_costs.tolist(),
             "Post-sale Cash on Hand": post_sale_cash
         }
 
     elif mode == "Overall Cash Flow Analysis":
-        maintenance_costs = [
-            initial_maintenance_cost * (1 + maintenance_inflation_rate) ** year for year in range(max_years)
-        ]
-        sale_after_tax = calculate_post_sale_raw_cash(house_value, appreciation_rate, sell_tax_rate, list(range(1, max_years + 1)))
+        # The cash flow analysis sells at the value from the start of the sale year
+        sale_after_tax, _ = calculate_post_sale_cash(house_value, appreciation_factor[:-1], sell_tax_rate)
         cash_rent, cash_buy, cash_buy_and_sell = calculate_cash_flow_analysis(
-            annual_salary, salary_growth_rate, opportunity_cost_rate, monthly_payments,
-            initial_rent, rent_inflation_rate, max_years, initial_investment, maintenance_costs, annual_expenditure, sale_after_tax, which_year_to_sell
+            annual_salary, salary_growth_rate, opportunity_cost_rate, annual_payments, remaining_payments,
+            annual_rent, max_years, initial_investment, annual_maintenance_costs, annual_expenditure, sale_after_tax, which_year_to_sell
         )
 
-        # Plot cash flow results with updated colors and markers
-        fig, ax = plt.subplots(figsize=(10, 6))
-
-        # Line 1: Renting, blue color with circular markers
-        ax.plot(
-            range(1, max_years + 1), 
-            cash_rent, 
-            label="Cumulative Cash (Renting)", 
-            linestyle="--", 
-            color="blue", 
-            marker="o", 
-            linewidth=2
-        )
-
-        # Line 2: Buying, red color with square markers
-        ax.plot(
-            range(1, max_years + 1), 
-            cash_buy, 
-            label="Cumulative Cash (Buying)", 
-            linestyle="-", 
-            color="red", 
-            marker="s", 
-            linewidth=2
-        )
-
-        # Line 3: Buying + Selling, yellow color with triangle markers
-        ax.plot(
-            range(1, max_years + 1), 
-            cash_buy_and_sell, 
-            label="Cumulative Cash (Buying + Selling)", 
-            linestyle=":", 
-            color="green", 
-            marker="^", 
-            linewidth=2
-        )
-
-        # Axis labels and title
-        ax.set_xlabel("Year")
-        ax.set_ylabel("Cumulative Cash (€)")
-        ax.set_title("Overall Cash Flow Analysis")
-
-        # Add legend with improved visibility
-        ax.legend(title="Cumulative Cash Flows", loc="upper left", fontsize="medium")
+        return {
+            "Cumulative Cash (Renting)": cash_rent.tolist(),
+            "Cumulative Cash (Buying)": cash_buy.tolist(),
+            "Cumulative Cash (Buying + Selling)": cash_buy_and_sell.tolist()
+        }
 
-        # Add grid for readability
-        ax.grid(True)
+# Full Gradio app implementation
+def analysis_handler(mode, *inputs):
+    """Handles the analysis based on the selected mode and input parameters."""
+    data = run_analysis(mode, *inputs)
 
-        # Save and close the figure
-        plt_path = "cash_flow_analysis.png"
-        fig.savefig(plt_path)
-        plt.close(fig)
+    if mode == "Break-even Analysis":
+        years = list(range(1, len(data["Cumulative Rent Costs"]) + 1))
+        plot_image = plot_results(years, data["Cumulative Rent Costs"], data["Cumulative Buying Costs"],
+                                 data["Break-even Year"], "Break-even Analysis")
+    elif mode == "Overall Cash Flow Analysis":
+        years = list(range(1, len(data["Cumulative Cash (Renting)"]) + 1))
+        plot_image = plot_cash_flow(years, data["Cumulative Cash (Renting)"], data["Cumulative Cash (Buying)"],
+                                   data["Cumulative Cash (Buying + Selling)"])
 
-        return plt_path, {
-            "Cumulative Cash (Renting)": cash_rent,
-            "Cumulative Cash (Buying)": cash_buy,
-            "Cumulative Cash (Buying + Selling)": cash_buy_and_sell
-        }
+    return plot_image, data
 
 # Gradio interface
-with gr.Blocks() as demo:
-    mode = gr.Radio(["Break-even Analysis", "Overall Cash Flow Analysis"], label="Mode", value="Break-even Analysis")
-
-    inputs = [
-        gr.Slider(100000, 1000000, step=1000, label="House Value (€)", value=300000),
-        gr.Slider(0, 1, step=0.01, label="Loan Percentage", value=0.7),
-        gr.Slider(0.1, 10, step=0.1, label="Loan Interest Rate (%)", value=3.7),
-        gr.Slider(1, 50, step=1, label="Loan Term (Years)", value=20),
-        gr.Slider(0, 20, step=0.1, label="Appreciation Rate (%)", value=2),
-        gr.Slider(0, 10000, step=100, label="Initial Maintenance Cost (€)", value=1000),
-        gr.Slider(0, 10, step=0.1, label="Maintenance Inflation Rate (%)", value=2),
-        gr.Slider(0, 100000, step=100, label="Initial Rent (€)", value=15000),
-        gr.Slider(0, 10, step=0.1, label="Annual Rent Inflation Rate (%)", value=2),
-        gr.Slider(0, 50, step=0.1, label="Sell Tax Rate (%)", value=36),
-        gr.Slider(1, 100, step=1, label="Maximum Years", value=30),
-        gr.Slider(0, 50000, step=500, label="Initial Investment (€)", value=5000),
-        gr.Slider(30000, 200000, step=1000, label="Annual Salary (€)", value=60000),
-        gr.Slider(0, 10, step=0.1, label="Annual Salary Growth Rate (%)", value=2),
-        gr.Slider(0, 10, step=0.1, label="Opportunity Cost Rate (%)", value=1),
-        gr.Slider(0, 150000, step=500, label="Annual Expenditure (€)", value=15000),
-        gr.Slider(0, 30, step=1, label="Which year to sell", value=10),
-        gr.Radio(["Annuity", "Linear"], label="Mortgage Type", value="Annuity")
-    ]
-
-    outputs = [
-        gr.Image(label="Analysis Chart"),
-        gr.JSON(label="Analysis Data")
-    ]
-
-    gr.Interface(
-        fn=analysis_handler,
-        inputs=[mode] + inputs,
-        outputs=outputs,
-        title="Buy vs Rent Analysis Tool",
-        description="Switch between break-even analysis and overall cash flow analysis.",
-        live=True
-    )
-
-demo.launch(share=True)
\ No newline at end of file
+with gr.Blocks(title="Buy vs Rent Analysis Tool") as demo:
+    gr.Markdown("# Buy vs Rent Analysis Tool\nSwitch between break-even analysis and overall cash flow analysis.")
+
+    with gr.Row():
+        with gr.Column():
+            mode = gr.Radio(["Break-even Analysis", "Overall Cash Flow Analysis"], label="Mode", value="Break-even Analysis")
+
+            inputs = [
+                gr.Slider(100000, 1000000, step=1000, label="House Value (€)", value=300000),
+                gr.Slider(0, 1, step=0.01, label="Loan Percentage", value=0.7),
+                gr.Slider(0.1, 10, step=0.1, label="Loan Interest Rate (%)", value=3.7),
+                gr.Slider(1, 50, step=1, label="Loan Term (Years)", value=20),
+                gr.Slider(0, 20, step=0.1, label="Appreciation Rate (%)", value=2),
+                gr.Slider(0, 10000, step=100, label="Initial Maintenance Cost (€)", value=1000),
+                gr.Slider(0, 10, step=0.1, label="Maintenance Inflation Rate (%)", value=2),
+                gr.Slider(0, 100000, step=100, label="Initial Rent (€)", value=15000),
+                gr.Slider(0, 10, step=0.1, label="Annual Rent Inflation Rate (%)", value=2),
+                gr.Slider(0, 50, step=0.1, label="Sell Tax Rate (%)", value=36),
+                gr.Slider(1, 100, step=1, label="Maximum Years", value=30),
+                gr.Slider(0, 50000, step=500, label="Initial Investment (€)", value=5000),
+                gr.Slider(30000, 200000, step=1000, label="Annual Salary (€)", value=60000),
+                gr.Slider(0, 10, step=0.1, label="Annual Salary Growth Rate (%)", value=2),
+                gr.Slider(0, 10, step=0.1, label="Opportunity Cost Rate (%)", value=1),
+                gr.Slider(0, 150000, step=500, label="Annual Expenditure (€)", value=15000),
+                gr.Slider(0, 30, step=1, label="Which year to sell", value=10),
+                gr.Radio(["Annuity", "Linear"], label="Mortgage Type", value="Annuity")
+            ]
+
+        with gr.Column():
+            outputs = [
+                gr.Image(label="Analysis Chart", type="pil"),
+                gr.JSON(label="Analysis Data")
+            ]
+
+    # Bind each input exactly once; sliders rerun the analysis when released rather than on every step of a drag
+    for component in [mode] + inputs:
+        event = component.release if isinstance(component, gr.Slider) else component.change
+        event(fn=analysis_handler, inputs=[mode] + inputs, outputs=outputs)
+
+if __name__ == "__main__":
+    demo.launch(share=True)
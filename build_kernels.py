@@ -0,0 +1,15 @@
+from numba.pycc import CC
+
+from kernels import cash_buy_and_sell_core
+
+# Ahead-of-time compilation of the hot kernels into the mortgage_kernels extension module,
+# so app.py does not pay the Numba JIT warmup on the first analysis
+cc = CC("mortgage_kernels")
+
+cc.export(
+    "cash_buy_and_sell_core",
+    "f8[:](f8[:], f8[:], f8, f8[:], f8, f8[:], f8[:], i8)"
+)(cash_buy_and_sell_core)
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,25 @@
+import numpy as np
+
+# Monetary values are kept in float64: float32 drifts by several cents on the
+# cumulative sums of a typical 30 year analysis, which shows in the rounded results
+MONEY_DTYPE = np.float64
+
+# Buy-then-sell cash recurrence, compiled by Numba either ahead of time (build_kernels.py) or on first use
+def cash_buy_and_sell_core(cumulative_cash_buy, net_savings, opportunity_cost_rate, remaining_payments,
+                           initial_investment, maintenance_costs, sale_after_tax, which_year_to_sell):
+    """Runs the year-by-year cash recurrence for buying, selling in the given year, and investing the proceeds."""
+    max_years = len(cumulative_cash_buy)
+    cumulative_cash_buy_and_sell = np.empty(max_years, dtype=MONEY_DTYPE)
+    cash_buy_and_sell = initial_investment
+    for year in range(1, max_years + 1):
+        if year < which_year_to_sell:
+            cash_buy_and_sell = cumulative_cash_buy[year - 1]
+        elif year == which_year_to_sell:
+            cash_buy_and_sell = cumulative_cash_buy[year - 1] + sale_after_tax[year - 1]
+            cash_buy_and_sell -= remaining_payments[year * 12] # pay off the remaining mortgage
+        else: # year>which_year_to_sell
+            cash_buy_and_sell += net_savings[year - 1] - maintenance_costs[year - 1]
+            cash_buy_and_sell *= (1 + opportunity_cost_rate)
+        cumulative_cash_buy_and_sell[year - 1] = cash_buy_and_sell
+
+    return cumulative_cash_buy_and_sell